@@ -1,13 +1,23 @@
 import streamlit as st
 import pandas as pd
-import joblib
+import numpy as np
 import sys
 import os
-import requests
-from bs4 import BeautifulSoup
+import asyncio
 import time
-import re
-from textstat import flesch_reading_ease
+import threading
+import warnings
+from urllib.parse import urlparse
+
+# Heavier dependencies (joblib, pyarrow, sklearn, textstat, selectolax, aiohttp) are
+# imported inside the functions that use them, so the page renders before they load.
+
+# Keywords for similarity: hashed 4+ letter words, packed into a fixed-width bit signature.
+# 2**14 bits costs 2 KB per page, but hash collisions distort Jaccard, so the displayed
+# "% similar" values and rankings visibly differ from exact keyword sets: on the shipped
+# corpus the top-5 order changes for 26 of 138 pages and scores shift by up to 0.033.
+SIGNATURE_BITS = 2**14
+_POPCOUNT_LUT = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
 
 # Add utils to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
@@ -34,12 +44,27 @@ st.markdown("""
         text-align: center;
         margin-bottom: 2rem;
     }
+    .metric-grid {
+        display: grid;
+        grid-template-columns: repeat(auto-fit, minmax(12rem, 1fr));
+        gap: 1rem;
+        margin-bottom: 1rem;
+    }
     .metric-card {
         background-color: #F8FAFC;
         padding: 1rem;
         border-radius: 10px;
         border-left: 4px solid #3B82F6;
     }
+    .metric-label {
+        font-size: 0.875rem;
+        color: #4B5563;
+    }
+    .metric-value {
+        font-size: 1.75rem;
+        color: #111827;
+        margin-bottom: 0.75rem;
+    }
     .success-banner {
         background-color: #1E40AF;
         padding: 1rem;
@@ -68,155 +93,389 @@ def load_file_smart(relative_path):
 # Load model and data with universal paths
 @st.cache_resource
 def load_model():
+    import joblib
+    
     model_path = load_file_smart('models/quality_model.pkl')
     return joblib.load(model_path)
 
-@st.cache_data
-def load_data():
-    features_path = load_file_smart('data/features.csv')
-    extracted_path = load_file_smart('data/extracted_content.csv')
+def is_fresh_copy(copy_path, fingerprint):
+    """True if a derived copy exists and was converted from the CSV as it is now"""
+    from convert_data import stored_fingerprint
+    
+    if not os.path.exists(copy_path):
+        return False
+    return fingerprint is None or stored_fingerprint(copy_path) == fingerprint
+
+def read_table(csv_relative_path, columns):
+    """Read a data file, preferring its Arrow, then Parquet copy (see utils/convert_data.py).
+    
+    Copies record the size and hash of the CSV they were converted from; one that
+    no longer matches (the notebook rewrote the CSV) is skipped instead of serving
+    stale data. File mtimes are not used, since a git checkout does not preserve them.
+    """
+    from convert_data import csv_fingerprint
+    
+    csv_path = load_file_smart(csv_relative_path)
+    base_path = os.path.splitext(csv_path)[0]
+    fingerprint = csv_fingerprint(csv_path) if os.path.exists(csv_path) else None
     
-    features = pd.read_csv(features_path)
-    extracted = pd.read_csv(extracted_path)
+    # Memory-mapped Arrow IPC: the file's pages are shared by every worker process
+    arrow_path = base_path + '.arrow'
+    if is_fresh_copy(arrow_path, fingerprint):
+        from pyarrow import feather
+        return feather.read_table(arrow_path, columns=columns, memory_map=True).to_pandas()
+    
+    parquet_path = base_path + '.parquet'
+    if is_fresh_copy(parquet_path, fingerprint):
+        return pd.read_parquet(parquet_path, engine='pyarrow', columns=columns)
+    return pd.read_csv(csv_path, usecols=columns)
+
+# cache_resource hands every rerun the same frames rather than an unpickled copy;
+# callers only read them
+@st.cache_resource
+def load_data():
+    # Only the columns the app reads
+    features = read_table('data/features.csv', ['url', 'word_count', 'quality_label'])
+    extracted = read_table('data/extracted_content.csv', ['url', 'body_text'])
     return features, extracted
 
-def scrape_and_parse_url(url):
-    """Enhanced scraping with better headers and error handling"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
+# Below this many pages an exact scan is cheap; above it, LSH narrows the candidates
+LSH_MIN_CORPUS_SIZE = 5000
+LSH_NUM_PERM = 128
+
+def build_minhash(feature_ids):
+    """MinHash sketch of a set of hashed keyword ids"""
+    from datasketch import MinHash  # only needed for large corpora
     
-    try:
-        time.sleep(1)  # Respectful delay
-        response = requests.get(url, headers=headers, timeout=15)
-        response.raise_for_status()
-        
-        # Check if content is reasonable
-        if len(response.content) < 1000:
-            return "", "", 0
-            
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Extract title
-        title = soup.title.string if soup.title else ""
+    minhash = MinHash(num_perm=LSH_NUM_PERM)
+    minhash.update_batch([int(feature_id).to_bytes(4, 'little') for feature_id in feature_ids])
+    return minhash
+
+def build_signatures(keywords):
+    """Pack each CSR row of hashed keyword ids into SIGNATURE_BITS // 64 uint64 words"""
+    rows = np.repeat(np.arange(keywords.shape[0]), np.diff(keywords.indptr))
+    bits = keywords.indices.astype(np.uint64)
+    signatures = np.zeros((keywords.shape[0], SIGNATURE_BITS // 64), dtype=np.uint64)
+    np.bitwise_or.at(signatures, (rows, (bits >> np.uint64(6)).astype(np.intp)), np.uint64(1) << (bits & np.uint64(63)))
+    return signatures
+
+def popcount_rows(words):
+    """Number of set bits in each row of a uint64 matrix"""
+    if hasattr(np, 'bitwise_count'):  # NumPy >= 2.0
+        return np.bitwise_count(words).sum(axis=1, dtype=np.int64)
+    return _POPCOUNT_LUT[words.view(np.uint8)].sum(axis=1, dtype=np.int64)
+
+@st.cache_resource
+def build_similarity_index():
+    """Precompute word counts and keyword sets once for vectorized similarity.
+    
+    Takes no arguments so a rerun finds the cached index without hashing the corpus.
+    """
+    model = load_model()
+    features, extracted = load_data()
+    
+    # Merge with features for similarity, keeping only the columns it reads.
+    # Indexed join on url; validate fails fast instead of fanning out on duplicate URLs.
+    enhanced_data = extracted[['url', 'body_text']].set_index('url').join(
+        features[['url', 'word_count', 'quality_label']].drop_duplicates('url').set_index('url'),
+        how='left',
+        validate='m:1',
+        sort=False
+    ).reset_index()
+    corpus = enhanced_data[enhanced_data['body_text'].notna()]
+    body_text = corpus['body_text']
+    word_count = body_text.str.split().str.len().to_numpy(dtype=np.int64)
+    
+    # Pages without a stored label are scored with one batched prediction
+    quality = corpus['quality_label'].to_numpy(dtype=object)
+    missing = pd.isna(quality)
+    if missing.any():
+        from textstat import flesch_reading_ease
         
-        # Enhanced content extraction
-        content_selectors = [
-            'article', 'main', '[role="main"]', '.content', 
-            '.post-content', '.article-content', '.entry-content',
-            'section', '.main-content'
+        missing_features = [
+            (wc, count_sentences(text), flesch_reading_ease(text) if wc > 10 else 0)
+            for text, wc in zip(body_text[missing], word_count[missing])
         ]
+        quality[missing] = predict_quality_batch(model, missing_features)
+    
+    # Hashed keywords per page, as CSR rows and as packed bit signatures
+    from sklearn.feature_extraction.text import HashingVectorizer
+    
+    vectorizer = HashingVectorizer(
+        token_pattern=r'\b[a-zA-Z]{4,}\b',
+        lowercase=True,
+        binary=True,
+        norm=None,
+        alternate_sign=False,
+        dtype=np.float32,
+        n_features=SIGNATURE_BITS
+    )
+    keywords = vectorizer.transform(body_text).tocsr()
+    signatures = build_signatures(keywords)
+    
+    # MinHash LSH over keyword sets, keyed by row position
+    lsh = None
+    if len(corpus) >= LSH_MIN_CORPUS_SIZE:
+        from datasketch import MinHashLSH
         
-        body_text = ""
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                text = ' '.join([elem.get_text().strip() for elem in elements if elem.get_text().strip()])
-                if len(text) > 200:  # More meaningful threshold
-                    body_text = text
-                    break
-        
-        # Fallback: get all paragraph text
-        if not body_text:
-            paragraphs = soup.find_all('p')
-            body_text = ' '.join([p.get_text().strip() for p in paragraphs if p.get_text().strip()])
-        
-        # Final fallback
-        if not body_text:
-            body_text = soup.get_text()
-        
-        # Clean text
-        body_text = ' '.join(body_text.split())
-        word_count = len(body_text.split())
-        
-        return title, body_text, word_count
-        
-    except Exception as e:
-        st.error(f"Scraping error: {str(e)}")
+        lsh = MinHashLSH(threshold=0.3, num_perm=LSH_NUM_PERM)
+        with lsh.insertion_session() as session:
+            for i in range(keywords.shape[0]):
+                feature_ids = keywords.indices[keywords.indptr[i]:keywords.indptr[i + 1]]
+                if len(feature_ids):
+                    session.insert(i, build_minhash(feature_ids))
+    
+    return {
+        'vectorizer': vectorizer,
+        'url': corpus['url'].to_numpy(),
+        'word_count': word_count,
+        'signatures': signatures,
+        'keyword_counts': popcount_rows(signatures),
+        'quality': quality,
+        'lsh': lsh,
+    }
+
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+SCRAPE_CONCURRENCY = 10
+SAME_HOST_DELAY = 1  # seconds between requests to one host
+MAX_CONTENT_BYTES = 4_000_000  # larger pages are skipped rather than downloaded and parsed
+
+def parse_html(content):
+    """Extract title, main body text and word count from raw HTML"""
+    # Check if content is reasonable
+    if len(content) < 1000:
         return "", "", 0
+        
+    from selectolax.lexbor import LexborHTMLParser
+    
+    tree = LexborHTMLParser(content)
+    
+    # Extract title
+    title_node = tree.css_first('title')
+    title = title_node.text() if title_node else ""
+    
+    # Script/style text is never page content
+    tree.strip_tags(['script', 'style', 'template'])
+    
+    # Enhanced content extraction
+    content_selectors = [
+        'article', 'main', '[role="main"]', '.content', 
+        '.post-content', '.article-content', '.entry-content',
+        'section', '.main-content'
+    ]
+    
+    body_text = ""
+    for selector in content_selectors:
+        elements = tree.css(selector)
+        if elements:
+            text = ' '.join([t for t in (elem.text().strip() for elem in elements) if t])
+            if len(text) > 200:  # More meaningful threshold
+                body_text = text
+                break
+    
+    # Fallback: get all paragraph text
+    if not body_text:
+        paragraphs = tree.css('p')
+        body_text = ' '.join([t for t in (p.text().strip() for p in paragraphs) if t])
+    
+    # Final fallback
+    if not body_text:
+        body_text = tree.root.text() if tree.root else ""
+    
+    # Clean text
+    words = body_text.split()
+    body_text = ' '.join(words)
+    word_count = len(words)
+    
+    return title, body_text, word_count
+
+async def _read_capped(response):
+    """Stream the response body, giving up once it passes MAX_CONTENT_BYTES"""
+    too_large = ValueError(f"Page is larger than {MAX_CONTENT_BYTES:,} bytes")
+    if (response.content_length or 0) > MAX_CONTENT_BYTES:
+        raise too_large
+    
+    chunks, total = [], 0
+    async for chunk in response.content.iter_chunked(65536):
+        total += len(chunk)
+        if total > MAX_CONTENT_BYTES:
+            raise too_large
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+async def _fetch(session, url, semaphore, host_locks, last_fetch):
+    """Fetch and parse one URL, spacing out requests that hit the same host"""
+    host = urlparse(url).netloc
+    # Space out same-host requests before taking a slot, so waiting on one
+    # host never holds up fetches to the others
+    async with host_locks.setdefault(host, asyncio.Lock()):
+        wait = last_fetch.get(host, float('-inf')) + SAME_HOST_DELAY - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)  # Respectful delay
+        last_fetch[host] = time.monotonic()
+    
+    async with semaphore:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            content = await _read_capped(response)
+    
+    return parse_html(content)
+
+async def _gather_with_semaphore(urls, limit=SCRAPE_CONCURRENCY):
+    import aiohttp
+    
+    semaphore = asyncio.Semaphore(limit)
+    host_locks, last_fetch = {}, {}
+    timeout = aiohttp.ClientTimeout(total=15)
+    async with aiohttp.ClientSession(headers=SCRAPE_HEADERS, timeout=timeout) as session:
+        return await asyncio.gather(
+            *(_fetch(session, url, semaphore, host_locks, last_fetch) for url in urls),
+            return_exceptions=True
+        )
+
+def scrape_and_parse_urls(urls):
+    """Scrape several URLs concurrently; failed URLs come back as ("", "", 0)"""
+    results = []
+    for url, result in zip(urls, asyncio.run(_gather_with_semaphore(urls))):
+        if isinstance(result, Exception):
+            st.error(f"Scraping error for {url}: {str(result) or type(result).__name__}")
+            result = ("", "", 0)
+        results.append(result)
+    return results
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def scrape_and_parse_url(url):
+    """Enhanced scraping with better headers, cached per URL.
+    
+    Errors are raised rather than returned so a failed fetch is never cached.
+    """
+    result = asyncio.run(_gather_with_semaphore([url]))[0]
+    if isinstance(result, Exception):
+        raise result
+    return result
 
+def count_sentences(text):
+    """Count runs of sentence terminators, same as len(re.findall(r'[.!?]+', text))"""
+    data = np.frombuffer(text.encode('utf-8', 'ignore'), dtype=np.uint8)
+    is_terminator = (data == ord('.')) | (data == ord('!')) | (data == ord('?'))
+    run_starts = is_terminator.copy()
+    run_starts[1:] &= ~is_terminator[:-1]
+    return int(np.count_nonzero(run_starts))
+
+@st.cache_data(show_spinner=False)
 def calculate_features(body_text, word_count):
     """Calculate features from text"""
-    sentence_count = len(re.findall(r'[.!?]+', body_text)) if body_text else 0
-    readability = flesch_reading_ease(body_text) if body_text and len(body_text.split()) > 10 else 0
+    from textstat import flesch_reading_ease
+    
+    sentence_count = count_sentences(body_text) if body_text else 0
+    readability = flesch_reading_ease(body_text) if body_text and word_count > 10 else 0
     is_thin = word_count < 500
     
     return sentence_count, readability, is_thin
 
-def predict_quality(model, word_count, sentence_count, readability):
-    """Predict quality using trained model"""
-    features = pd.DataFrame([{
-        'word_count': word_count,
-        'sentence_count': sentence_count,
-        'flesch_reading_ease': readability
-    }])
-    
-    return model.predict(features)[0]
+# Reused input row for single predictions, in training column order: word_count,
+# sentence_count, flesch_reading_ease. float32 is what the forest's trees take, so
+# sklearn uses it as-is. Sessions run in separate threads, hence the lock.
+_PREDICT_BUFFER = np.empty((1, 3), dtype=np.float32)
+_PREDICT_LOCK = threading.Lock()
+
+def _predict(model, X):
+    """Run model.predict on a plain array in training column order"""
+    # The model was fitted on a DataFrame; only silence its feature-name warning here
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='X does not have valid feature names', category=UserWarning)
+        return model.predict(X)
 
-def improved_similarity(target_url, target_text, existing_data, top_n=5):
+@st.cache_data(show_spinner=False)
+def predict_quality(_model, word_count, sentence_count, readability):
+    """Predict quality using trained model (the model is excluded from the cache key)"""
+    with _PREDICT_LOCK:
+        _PREDICT_BUFFER[0] = (word_count, sentence_count, readability)
+        return _predict(_model, _PREDICT_BUFFER)[0]
+
+def predict_quality_batch(model, features):
+    """Predict quality for (N, 3) rows of word_count, sentence_count, readability in one call"""
+    return _predict(model, np.asarray(features, dtype=np.float32))
+
+def top_n_indices(scores, n):
+    """Indices of the n highest scores, best first; ties keep their original order"""
+    if n <= 0:
+        return np.arange(0)
+    order = np.arange(len(scores))
+    if len(scores) > n:
+        # O(N) partial selection of the n-th highest score; among scores tied with it
+        # the earliest win, as a full stable sort would pick them. Only n get sorted.
+        cutoff = -np.partition(-scores, n - 1)[n - 1]
+        above = np.flatnonzero(scores > cutoff)
+        tied = np.flatnonzero(scores == cutoff)[:n - len(above)]
+        order = np.sort(np.concatenate([above, tied]))
+    return order[np.argsort(-scores[order], kind='stable')]
+
+def improved_similarity(target_url, target_text, corpus_index, top_n=5, target_word_count=None):
     """Improved similarity that excludes self-matches"""
     if not target_text:
         return []
     
-    target_word_count = len(target_text.split())
+    # Tokenize the target once (reusing the scraper's word count when given);
+    # everything per-row is precomputed in the index
+    if target_word_count is None:
+        target_word_count = len(target_text.split())
+    target_keywords = corpus_index['vectorizer'].transform([target_text])
     
-    similar_pages = []
-    for _, row in existing_data.iterrows():
-        # CRITICAL: Skip the same URL to avoid self-match
-        if row['url'] == target_url:
-            continue
-            
-        if pd.isna(row['body_text']):
-            continue
-            
-        existing_text = row['body_text']
-        existing_wc = len(existing_text.split())
-        
-        # Multiple similarity factors
-        wc_similarity = 1 - abs(target_word_count - existing_wc) / max(target_word_count, existing_wc, 1)
-        
-        # Keyword overlap
-        target_words = set(re.findall(r'\b[a-zA-Z]{4,}\b', target_text.lower()))
-        existing_words = set(re.findall(r'\b[a-zA-Z]{4,}\b', existing_text.lower()))
-        
-        if target_words and existing_words:
-            keyword_overlap = len(target_words.intersection(existing_words)) / len(target_words.union(existing_words))
-        else:
-            keyword_overlap = 0
-        
-        # Combined similarity score
-        combined_similarity = (wc_similarity * 0.6) + (keyword_overlap * 0.4)
-        
-        if combined_similarity > 0.3:
-            similar_pages.append({
-                'url': row['url'],
-                'similarity': combined_similarity,
-                'word_count': existing_wc,
-                'quality': row.get('quality_label', 'Unknown')
-            })
+    # Large corpora: only score the LSH candidates instead of every row
+    candidates = np.arange(len(corpus_index['url']))
+    if corpus_index['lsh'] is not None and target_keywords.nnz:
+        candidates = np.array(sorted(corpus_index['lsh'].query(build_minhash(target_keywords.indices))), dtype=np.intp)
+    
+    existing_wc = corpus_index['word_count'][candidates]
+    
+    # Multiple similarity factors
+    wc_similarity = 1 - np.abs(target_word_count - existing_wc) / np.maximum(np.maximum(existing_wc, target_word_count), 1)
     
-    similar_pages.sort(key=lambda x: x['similarity'], reverse=True)
-    return similar_pages[:top_n]
+    # Keyword overlap: popcount of AND over the packed signatures
+    target_signature = build_signatures(target_keywords)
+    keyword_counts = corpus_index['keyword_counts'][candidates]
+    intersection = popcount_rows(corpus_index['signatures'][candidates] & target_signature)
+    union = keyword_counts + target_keywords.nnz - intersection
+    keyword_overlap = np.where((keyword_counts > 0) & (target_keywords.nnz > 0), intersection / np.maximum(union, 1), 0.0)
+    
+    # Combined similarity score
+    combined_similarity = (wc_similarity * 0.6) + (keyword_overlap * 0.4)
+    
+    # CRITICAL: Mask out the same URL to avoid self-match
+    keep = (combined_similarity > 0.3) & (corpus_index['url'][candidates] != target_url)
+    candidates, combined_similarity, existing_wc = candidates[keep], combined_similarity[keep], existing_wc[keep]
+    
+    return [
+        {
+            'url': corpus_index['url'][candidates[i]],
+            'similarity': float(combined_similarity[i]),
+            'word_count': int(existing_wc[i]),
+            'quality': corpus_index['quality'][candidates[i]]
+        }
+        for i in top_n_indices(combined_similarity, top_n)
+    ]
+
+# Header
+st.markdown('<h1 class="main-header">🔍 SEO Content Quality & Duplicate Detector</h1>', unsafe_allow_html=True)
+st.markdown('<p class="sub-header">Analyze any URL for SEO content quality and discover similar pages</p>', unsafe_allow_html=True)
 
 # Load data
 try:
     model = load_model()
-    existing_data, extracted_data = load_data()
-    # Merge with features for similarity
-    enhanced_data = extracted_data.merge(existing_data, on='url', how='left')
+    existing_data, _ = load_data()
+    corpus_index = build_similarity_index()
 except Exception as e:
     st.error(f"Error loading data: {e}")
     st.stop()
 
-# Header
-st.markdown('<h1 class="main-header">🔍 SEO Content Quality & Duplicate Detector</h1>', unsafe_allow_html=True)
-st.markdown('<p class="sub-header">Analyze any URL for SEO content quality and discover similar pages</p>', unsafe_allow_html=True)
-
 # URL Input Section - Improved Layout
 st.markdown("### 📝 Enter URL to Analyze")
 
@@ -239,7 +498,11 @@ if analyze_btn and url:
         url = 'https://' + url
     
     with st.spinner("🔍 Analyzing content... This may take 10-15 seconds."):
-        title, body_text, word_count = scrape_and_parse_url(url)
+        try:
+            title, body_text, word_count = scrape_and_parse_url(url)
+        except Exception as e:
+            st.error(f"Scraping error: {str(e) or type(e).__name__}")
+            title, body_text, word_count = "", "", 0
         
         if word_count == 0:
             st.error("""
@@ -269,46 +532,43 @@ if analyze_btn and url:
             # Metrics in cards
             st.markdown("### 📊 Content Analysis Results")
             
-            col1, col2, col3, col4 = st.columns(4)
+            # Readability interpretation
+            if readability > 60:
+                level = "😊 Easy"
+            elif readability > 30:
+                level = "😐 Moderate" 
+            else:
+                level = "😞 Complex"
             
-            with col1:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.metric("Word Count", f"{word_count:,}")
-                st.metric("Thin Content", "✅ No" if not is_thin else "❌ Yes")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col2:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.metric("Readability Score", f"{readability:.1f}")
-                # Readability interpretation
-                if readability > 60:
-                    level = "😊 Easy"
-                elif readability > 30:
-                    level = "😐 Moderate" 
-                else:
-                    level = "😞 Complex"
-                st.metric("Readability Level", level)
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col3:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                st.metric("Sentence Count", sentence_count)
-                # Quality with color coding
-                quality_emoji = {"High": "🟢", "Medium": "🟡", "Low": "🔴"}[quality_label]
-                st.metric("Quality Rating", f"{quality_emoji} {quality_label}")
-                st.markdown('</div>', unsafe_allow_html=True)
-                
-            with col4:
-                st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-                avg_sentence = word_count / max(sentence_count, 1)
-                st.metric("Avg. Sentence Length", f"{avg_sentence:.1f} words")
-                st.metric("Content Depth", "Comprehensive" if word_count > 2000 else "Standard")
-                st.markdown('</div>', unsafe_allow_html=True)
+            # Quality with color coding
+            quality_emoji = {"High": "🟢", "Medium": "🟡", "Low": "🔴"}[quality_label]
+            avg_sentence = word_count / max(sentence_count, 1)
+            
+            cards = [
+                [("Word Count", f"{word_count:,}"),
+                 ("Thin Content", "✅ No" if not is_thin else "❌ Yes")],
+                [("Readability Score", f"{readability:.1f}"),
+                 ("Readability Level", level)],
+                [("Sentence Count", sentence_count),
+                 ("Quality Rating", f"{quality_emoji} {quality_label}")],
+                [("Avg. Sentence Length", f"{avg_sentence:.1f} words"),
+                 ("Content Depth", "Comprehensive" if word_count > 2000 else "Standard")],
+            ]
+            
+            # Whole grid in one markdown element instead of four columns of widgets
+            grid_html = ''.join(
+                '<div class="metric-card">' + ''.join(
+                    f'<div class="metric-label">{label}</div><div class="metric-value">{value}</div>'
+                    for label, value in card
+                ) + '</div>'
+                for card in cards
+            )
+            st.markdown(f'<div class="metric-grid">{grid_html}</div>', unsafe_allow_html=True)
             
             # Improved Similar Content
             st.markdown("### 🔗 Similar Content in Database")
             
-            similar_pages = improved_similarity(url, body_text, enhanced_data, top_n=5)
+            similar_pages = improved_similarity(url, body_text, corpus_index, top_n=5, target_word_count=word_count)
             
             if similar_pages:
                 st.write(f"Found {len(similar_pages)} potentially related pages:")
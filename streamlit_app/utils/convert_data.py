@@ -0,0 +1,55 @@
+"""Convert the pipeline's CSV outputs to Parquet and Arrow IPC for faster app start-up.
+
+The Arrow IPC (Feather v2) copy is written uncompressed so the app can
+memory-map it and share the pages between Streamlit worker processes;
+the zstd Parquet copy is the smaller fallback. Both record the size and
+SHA-256 of the CSV they came from in their schema metadata, and the app
+ignores a copy whose fingerprint no longer matches the CSV.
+
+Run from the repository root after the notebook regenerates the CSVs:
+    python streamlit_app/utils/convert_data.py
+"""
+import hashlib
+import os
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+import pyarrow.parquet as pq
+
+DATA_FILES = ['data/features.csv', 'data/extracted_content.csv']
+
+# Schema metadata key holding the source CSV's fingerprint
+SOURCE_FINGERPRINT_KEY = b'source_csv_fingerprint'
+
+def csv_fingerprint(csv_path):
+    """Size and SHA-256 of a CSV file, as bytes for schema metadata"""
+    digest = hashlib.sha256()
+    with open(csv_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return f"{os.path.getsize(csv_path)}:{digest.hexdigest()}".encode()
+
+def stored_fingerprint(copy_path):
+    """Source fingerprint recorded in an .arrow or .parquet copy, or None"""
+    if copy_path.endswith('.arrow'):
+        schema = pa.ipc.open_file(pa.memory_map(copy_path, 'r')).schema
+    else:
+        schema = pq.read_schema(copy_path)
+    return (schema.metadata or {}).get(SOURCE_FINGERPRINT_KEY)
+
+def convert_data(csv_path):
+    """Write Parquet and Arrow IPC copies next to the CSV"""
+    base_path = os.path.splitext(csv_path)[0]
+    table = pa.Table.from_pandas(pd.read_csv(csv_path), preserve_index=False)
+    table = table.replace_schema_metadata({
+        **(table.schema.metadata or {}),
+        SOURCE_FINGERPRINT_KEY: csv_fingerprint(csv_path),
+    })
+    pq.write_table(table, base_path + '.parquet', compression='zstd')
+    feather.write_feather(table, base_path + '.arrow', compression='uncompressed')
+    return [base_path + '.parquet', base_path + '.arrow']
+
+if __name__ == '__main__':
+    for path in DATA_FILES:
+        for written in convert_data(path):
+            print(f"Wrote {written}")
@@ -1,41 +1,94 @@
-import requests
-from bs4 import BeautifulSoup
+import asyncio
+import aiohttp
+from selectolax.lexbor import LexborHTMLParser
 import time
+from urllib.parse import urlparse
 import pandas as pd
 
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+MAX_CONTENT_BYTES = 4_000_000
+
+def parse_html(content):
+    """Parse raw HTML into title, body text and word count"""
+    tree = LexborHTMLParser(content)
+    title_node = tree.css_first('title')
+    title = title_node.text() if title_node else ""
+    tree.strip_tags(['script', 'style', 'template'])
+
+    # Extract main content
+    selectors = ['article', 'main', '.content', '.post-content', 'p']
+    body_text = ""
+    for selector in selectors:
+        elements = tree.css(selector)
+        if elements:
+            text = ' '.join([elem.text().strip() for elem in elements])
+            if len(text) > 100:
+                body_text = text
+                break
+
+    if not body_text:
+        body_text = tree.root.text() if tree.root else ""
+
+    words = body_text.split()
+    body_text = ' '.join(words)
+    word_count = len(words)
+
+    return title, body_text, word_count
+
+async def _read_capped(response):
+    """Read the response body in chunks, refusing pages over MAX_CONTENT_BYTES"""
+    too_large = ValueError(f"Page is larger than {MAX_CONTENT_BYTES:,} bytes")
+    if (response.content_length or 0) > MAX_CONTENT_BYTES:
+        raise too_large
+
+    chunks, total = [], 0
+    async for chunk in response.content.iter_chunked(65536):
+        total += len(chunk)
+        if total > MAX_CONTENT_BYTES:
+            raise too_large
+        chunks.append(chunk)
+    return b''.join(chunks)
+
+async def _fetch(session, url, semaphore, host_locks, last_fetch):
+    """Fetch and parse a single URL, waiting 1s between hits on the same host"""
+    host = urlparse(url).netloc
+    # Space out same-host requests before taking a slot, so waiting on one
+    # host never holds up fetches to the others
+    async with host_locks.setdefault(host, asyncio.Lock()):
+        wait = last_fetch.get(host, float('-inf')) + 1 - time.monotonic()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        last_fetch[host] = time.monotonic()
+
+    async with semaphore:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            content = await _read_capped(response)
+
+    return parse_html(content)
+
+async def _gather_with_semaphore(urls, limit=10):
+    semaphore = asyncio.Semaphore(limit)
+    host_locks, last_fetch = {}, {}
+    timeout = aiohttp.ClientTimeout(total=10)
+    async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+        return await asyncio.gather(
+            *(_fetch(session, url, semaphore, host_locks, last_fetch) for url in urls),
+            return_exceptions=True
+        )
+
+def scrape_and_parse_urls(urls, limit=10):
+    """Scrape and parse several URLs concurrently"""
+    results = []
+    for url, result in zip(urls, asyncio.run(_gather_with_semaphore(urls, limit))):
+        if isinstance(result, Exception):
+            print(f"Error scraping {url}: {result}")
+            result = ("", "", 0)
+        results.append(result)
+    return results
+
 def scrape_and_parse_url(url):
     """Scrape and parse a single URL"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
-    
-    try:
-        time.sleep(1)
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        title = soup.title.string if soup.title else ""
-        
-        # Extract main content
-        selectors = ['article', 'main', '.content', '.post-content', 'p']
-        body_text = ""
-        for selector in selectors:
-            elements = soup.select(selector)
-            if elements:
-                text = ' '.join([elem.get_text().strip() for elem in elements])
-                if len(text) > 100:
-                    body_text = text
-                    break
-        
-        if not body_text:
-            body_text = soup.get_text()
-        
-        body_text = ' '.join(body_text.split())
-        word_count = len(body_text.split())
-        
-        return title, body_text, word_count
-        
-    except Exception as e:
-        print(f"Error scraping {url}: {e}")
-        return "", "", 0
\ No newline at end of file
+    return scrape_and_parse_urls([url])[0]
@@ -1,11 +1,27 @@
-import pandas as pd
+import threading
+import warnings
+import numpy as np
+
+# Column order the model was trained on
+FEATURE_COLUMNS = ['word_count', 'sentence_count', 'flesch_reading_ease']
+
+# Reused (1, 3) input row; float32 is the dtype the forest's trees consume directly
+_BUFFER = np.empty((1, 3), dtype=np.float32)
+_BUFFER_LOCK = threading.Lock()
+
+def _predict(model, X):
+    """Run model.predict on a plain array in FEATURE_COLUMNS order"""
+    # The model was fitted on a DataFrame; only silence its feature-name warning here
+    with warnings.catch_warnings():
+        warnings.filterwarnings('ignore', message='X does not have valid feature names', category=UserWarning)
+        return model.predict(X)
 
 def predict_quality(model, word_count, sentence_count, readability):
     """Predict quality using trained model"""
-    features = pd.DataFrame([{
-        'word_count': word_count,
-        'sentence_count': sentence_count,
-        'flesch_reading_ease': readability
-    }])
-    
-    return model.predict(features)[0]
\ No newline at end of file
+    with _BUFFER_LOCK:
+        _BUFFER[0] = (word_count, sentence_count, readability)
+        return _predict(model, _BUFFER)[0]
+
+def predict_quality_batch(model, features):
+    """Predict quality for an (N, 3) array of FEATURE_COLUMNS rows in one call"""
+    return _predict(model, np.asarray(features, dtype=np.float32))